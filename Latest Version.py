@@ -1,72 +1,140 @@
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 import math
 import json
+import logging
 import os
+import threading
+import time
 import sv_ttk
 import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 import weakref
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image, ImageTk, ImageDraw, ImageFont
     PIL_AVAILABLE = True
 except ImportError:
     PIL_AVAILABLE = False
     print("PIL not available - textures will not be supported")
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Global texture cache to prevent memory leaks and improve performance
-_texture_cache = {}
-_max_cache_size = 1000  # Limit cache size
+log = logging.getLogger(__name__)
 
-def clear_old_cache_entries():
-    """Clear oldest cache entries when cache gets too large"""
-    global _texture_cache
-    if len(_texture_cache) > _max_cache_size:
-        # Remove oldest 20% of entries
-        items = list(_texture_cache.items())
-        to_remove = len(items) // 5
-        for i in range(to_remove):
-            del _texture_cache[items[i][0]]
+# Limit for the texture caches below
+_max_cache_size = 1000
 
+# Cold textures are warped on worker threads (PIL releases the GIL while
+# decoding, resizing and transforming); the lock guards the source caches
+_texture_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+_texture_cache_lock = threading.Lock()
 
-@lru_cache(maxsize=128)
-def _find_perspective_coeffs_cached(src_pts_tuple, dst_pts_tuple):
-    """Cached version of perspective coefficient calculation"""
-    src_pts = [list(pt) for pt in src_pts_tuple]
-    dst_pts = [list(pt) for pt in dst_pts_tuple]
-    
-    A = []
-    b = []
-    for (xs, ys), (xd, yd) in zip(src_pts, dst_pts):
-        A.append([ xs, ys, 1,   0,   0, 0, -xd*xs, -xd*ys ])
-        A.append([  0,   0, 0,  xs,  ys, 1, -yd*xs, -yd*ys ])
-        b.extend([xd, yd])
-    A = np.array(A, dtype=np.float64)
-    b = np.array(b, dtype=np.float64)
-    return tuple(np.linalg.solve(A, b))
+
+# Image.point() shading tables keyed by factor (only the three face factors in practice)
+_shading_tables = {}
+
+# Decoded + resized RGBA textures keyed by (path, size); direction and shading
+# don't change the source bitmap, so each PNG is read and decoded once per size.
+# Both source caches are LRU: hits move to the end, evictions pop the front
+_decoded_cache = OrderedDict()
+
+# Resized + shaded source textures keyed by (path, size, shade_factor); shared
+# by every warp of the same texture so disk reads and shading happen once
+_shaded_source_cache = OrderedDict()
+
+
+def _face_affine_coeffs(direction, size):
+    """
+    Closed-form inverse affine (output -> source) for a diamond face.
+    Every face is a parallelogram, so no perspective solve is needed.
+    """
+    if direction == 'top':
+        return (1, 2, -size / 2, -1, 2, size / 2)
+    elif direction == 'left':
+        return (2, 0, 0, -1, 2, -size / 2)
+    elif direction == 'right':
+        return (2, 0, -size, 1, 2, -3 * size / 2)
+    raise ValueError("direction must be 'left','right' or 'top'")
+
+
+def _shading_table(factor):
+    """Get the RGBA Image.point() table for a shading factor"""
+    table = _shading_tables.get(factor)
+    if table is None:
+        # Fixed-point multiply (8 fractional bits), saturated to 255
+        scaled = (np.arange(256, dtype=np.uint32) * round(factor * 256)) >> 8
+        rgb = np.minimum(scaled, 255).tolist()
+        # Same table for R, G and B; identity for alpha
+        table = rgb * 3 + list(range(256))
+        _shading_tables[factor] = table
+    return table
 
 
 def apply_shading_to_image(image, factor):
     """Apply darkening/lightening to an image"""
     if factor == 1.0:
         return image
-    
-    # Convert to numpy array for faster processing
-    img_array = np.array(image)
-    
-    # Apply factor to RGB channels, keep alpha unchanged
-    img_array[:, :, :3] = np.clip(img_array[:, :, :3] * factor, 0, 255).astype(np.uint8)
-    
-    return Image.fromarray(img_array)
 
+    # Single C-level table remap of RGB, alpha unchanged
+    return image.point(_shading_table(factor))
 
-def skew_to_trapezoid_optimized(path, direction, size, factor=0.2):
-    """
-    Optimized version with global caching, size parameter, and shading
-    """
-    global _texture_cache
-    
+
+def _load_resized_source(path, size):
+    """Read, decode and resize a texture once per (path, size)"""
+    key = (path, size)
+    with _texture_cache_lock:
+        im = _decoded_cache.get(key)
+        if im is not None:
+            _decoded_cache.move_to_end(key)
+    if im is None:
+        im = Image.open(path).convert("RGBA")
+
+        # Resize image first if needed
+        if im.size[0] != size:
+            im = im.resize((size, size), Image.LANCZOS)
+
+        with _texture_cache_lock:
+            _decoded_cache[key] = im
+            while len(_decoded_cache) > _max_cache_size:
+                # Drop the least recently used entry
+                _decoded_cache.popitem(last=False)
+    return im
+
+
+def _load_shaded_source(path, size, shade_factor):
+    """Shade a decoded texture once for all of its warps"""
+    key = (path, size, shade_factor)
+    with _texture_cache_lock:
+        im = _shaded_source_cache.get(key)
+        if im is not None:
+            _shaded_source_cache.move_to_end(key)
+    if im is None:
+        im = apply_shading_to_image(_load_resized_source(path, size), shade_factor)
+
+        with _texture_cache_lock:
+            _shaded_source_cache[key] = im
+            while len(_shaded_source_cache) > _max_cache_size:
+                # Drop the least recently used entry
+                _shaded_source_cache.popitem(last=False)
+    return im
+
+
+@lru_cache(maxsize=_max_cache_size)
+def _make_face_image(path, direction, size, factor):
+    """Build the warped RGBA image for one face; LRU-cached on the arguments"""
     # Determine shading factor based on direction (matching fallback block shading)
     if direction == 'top':
         shade_factor = 1.2  # Brighten top face
@@ -76,85 +144,201 @@ def skew_to_trapezoid_optimized(path, direction, size, factor=0.2):
         shade_factor = 0.6  # Darken right face more
     else:
         shade_factor = 1.0
-    
-    # Create cache key including all parameters and shading
-    cache_key = f"{path}_{direction}_{size}_{factor}_{shade_factor}"
-    
-    if cache_key in _texture_cache:
-        return _texture_cache[cache_key]
-    
+
     try:
-        im = Image.open(path).convert("RGBA")
-        original_size = im.size[0]
-        
-        # Resize image first if needed
-        if original_size != size:
-            im = im.resize((size, size), Image.LANCZOS)
-        
-        # Apply shading before transformation
-        if shade_factor != 1.0:
-            im = apply_shading_to_image(im, shade_factor)
-        
-        w, h = size, size
-        height = size / 2
+        # Resized and shaded before transformation
+        im = _load_shaded_source(path, size, shade_factor)
 
-        # center‑top of diamond:
-        x = size / 2
-        y = 0
+        w, h = size, size
 
-        # four corners of the target trapezoid
-        if direction == 'top':
-           dst = [
-               ( x,              y               ),  # top
-               ( x + size/2,     y + size/4      ),  # right
-               ( x,              y + size/2      ),  # bottom
-               ( x - size/2,     y + size/4      )   # left
-           ]
-        elif direction == 'left':
-           dst = [
-               ( x - size/2,     y + size/4          ),  # UL
-               ( x,              y + size/2          ),  # UR
-               ( x,              y + size/2 + height ),  # LR
-               ( x - size/2,     y + size/4 + height )   # LL
-           ]
-        elif direction == 'right':
-           dst = [
-               ( x,              y + size/2          ),  # UL
-               ( x + size/2,     y + size/4          ),  # UR
-               ( x + size/2,     y + size/4 + height ),  # LR
-               ( x,              y + size/2 + height )   # LL
-           ]
-        else:
-            raise ValueError("direction must be 'left','right' or 'top'")
-        
-        src = [(0, 0), (size, 0), (size, size), (0, size)]
+        # Each face is an affine skew of the square texture
+        coeffs = _face_affine_coeffs(direction, size)
 
-        # Use cached coefficient calculation
-        src_tuple = tuple(tuple(pt) for pt in src)
-        dst_tuple = tuple(tuple(pt) for pt in dst)
-        coeffs = _find_perspective_coeffs_cached(dst_tuple, src_tuple)
+        # Small faces are a few texels across, where filtering only blurs;
+        # nearest is cheaper there and keeps the pixel-art look
+        resample = Image.NEAREST if size <= 32 else Image.BILINEAR
 
         # warp
         out = im.transform(
             (w, h),
-            Image.PERSPECTIVE,
+            Image.AFFINE,
             data=coeffs,
-            resample=Image.BICUBIC,
+            resample=resample,
             fillcolor=(0, 0, 0, 0)  # transparent
         )
 
-        # Cache the result
-        photo_image = ImageTk.PhotoImage(out)
-        _texture_cache[cache_key] = photo_image
+        return out
+
+    except Exception:
+        log.exception("Texture generation error")
+        return None
+
+
+# Visible-face bits returned by project_blocks
+FACE_LEFT = 1   # faces +rz
+FACE_RIGHT = 2  # faces +rx
+FACE_TOP = 4    # faces +y
+
+# Face draw order; the position is also the face's column in the sprite atlas
+_FACE_ORDER = (('left', FACE_LEFT), ('right', FACE_RIGHT), ('top', FACE_TOP))
+
+# World-space (dx, dz) steps for +rx and +rz at each view rotation
+_ROTATION_STEPS = {
+    0: ((1, 0), (0, 1)),
+    90: ((0, 1), (-1, 0)),
+    180: ((-1, 0), (0, -1)),
+    270: ((0, -1), (1, 0)),
+}
+
+# Per rotation, the 2x2 integer matrix and offset (in units of size - 1) that
+# take world (x, z) straight to the iso diagonals (rx - rz, rx + rz); screen
+# x/y are those times half_w/half_h and rx + rz is also the depth key
+_ISO_MATRICES = {
+    0: (np.array([[1, 1], [-1, 1]]), np.array([0, 0])),
+    90: (np.array([[1, -1], [1, 1]]), np.array([-1, 1])),
+    180: (np.array([[-1, -1], [1, -1]]), np.array([0, 2])),
+    270: (np.array([[-1, 1], [-1, -1]]), np.array([1, 1])),
+}
+
+
+def project_cells(xyz, rotation, size, half_w, half_h, tile_h):
+    """Iso offsets (iso_x, iso_y) of arbitrary (N, 3) x/z/y cells, occupied or not"""
+    xyz = np.asarray(xyz)
+    mat, offset = _ISO_MATRICES.get(rotation, _ISO_MATRICES[0])
+    diag = xyz[:, :2] @ mat + offset * (size - 1)
+    return diag[:, 0] * half_w, diag[:, 1] * half_h - xyz[:, 2] * tile_h
+
+
+@lru_cache(maxsize=8)
+def _draw_order(size, rotation):
+    """
+    Flat indices of every cell of a size**3 grid in back-to-front draw order
+    for a rotation: by layer, then diagonal rx + rz, then x. The order only
+    depends on the cell, so it is computed once and filtered per frame.
+    """
+    x, z, y = np.indices((size, size, size)).reshape(3, -1)
+    mat, offset = _ISO_MATRICES.get(rotation, _ISO_MATRICES[0])
+    depth = x * mat[0, 1] + z * mat[1, 1] + offset[1] * (size - 1)
+    return np.lexsort((x, depth, y))
+
+
+def _project_blocks_numpy(grid, rotation, half_w, half_h, tile_h, occ):
+    """Vectorized projection and face culling, in the static draw order"""
+    size = grid.shape[0]
+    s1 = size - 1
+    cells = grid.ravel()
+    order = _draw_order(size, rotation)
+    flat = order[cells[order] != 0]
+    x, z, y = np.unravel_index(flat, grid.shape)
+    
+    # A face is hidden when the neighbour it faces is occupied; the padded
+    # copy makes the +/-1 lookups at the build edges land on empty cells
+    (rxx, rxz), (rzx, rzz) = _ROTATION_STEPS.get(rotation, _ROTATION_STEPS[0])
+    padded = np.pad(occ, 1)
+    px, pz, py = x + 1, z + 1, y + 1
+    faces = (np.where(padded[px + rzx, pz + rzz, py], 0, FACE_LEFT)
+             | np.where(padded[px + rxx, pz + rxz, py], 0, FACE_RIGHT)
+             | np.where(padded[px, pz, py + 1], 0, FACE_TOP))
+    
+    visible = faces != 0
+    x, z, y, flat = x[visible], z[visible], y[visible], flat[visible]
+    mat, offset = _ISO_MATRICES.get(rotation, _ISO_MATRICES[0])
+    diag = np.column_stack((x, z)) @ mat + offset * s1
+    
+    iso_x = diag[:, 0] * half_w
+    iso_y = diag[:, 1] * half_h - y * tile_h
+    return cells[flat].astype(np.int32), iso_x, iso_y, faces[visible]
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _project_scene_jit(grid, occ, rotation, half_w, half_h, tile_h):
+        """
+        Compiled projection, face culling and depth ordering straight off the
+        block grid. Cells are visited in draw order (layer, then diagonal
+        rx + rz, then x), which is the order the stable depth sort gives, so
+        nothing needs sorting.
+        """
+        size = grid.shape[0]
+        s1 = size - 1
         
-        # Clean old entries if cache is getting large
-        clear_old_cache_entries()
+        # Neighbour steps for +rx / +rz, and z on diagonal d as zd*d + za + zb*x
+        if rotation == 90:
+            rxx, rxz, rzx, rzz = 0, 1, -1, 0
+            zd, za, zb = 1, -s1, 1
+        elif rotation == 180:
+            rxx, rxz, rzx, rzz = -1, 0, 0, -1
+            zd, za, zb = -1, 2 * s1, -1
+        elif rotation == 270:
+            rxx, rxz, rzx, rzz = 0, -1, 1, 0
+            zd, za, zb = -1, s1, 1
+        else:
+            rxx, rxz, rzx, rzz = 1, 0, 0, 1
+            zd, za, zb = 1, 0, -1
         
-        return photo_image
+        n = 0
+        for x in range(size):
+            for z in range(size):
+                for y in range(size):
+                    if grid[x, z, y]:
+                        n += 1
         
-    except Exception as e:
-        print(f"Texture generation error: {e}")
-        return None
+        out_ids = np.empty(n, np.int32)
+        iso_x = np.empty(n, np.float64)
+        iso_y = np.empty(n, np.float64)
+        faces = np.empty(n, np.int64)
+        count = 0
+        for y in range(size):
+            for d in range(2 * size - 1):
+                for x in range(size):
+                    z = zd * d + za + zb * x
+                    if z < 0 or z >= size:
+                        continue
+                    block = grid[x, z, y]
+                    if block == 0:
+                        continue
+                    
+                    mask = 0
+                    nx = x + rzx
+                    nz = z + rzz
+                    if not (0 <= nx < size and 0 <= nz < size and occ[nx, nz, y]):
+                        mask |= 1
+                    nx = x + rxx
+                    nz = z + rxz
+                    if not (0 <= nx < size and 0 <= nz < size and occ[nx, nz, y]):
+                        mask |= 2
+                    if not (y + 1 < size and occ[x, z, y + 1]):
+                        mask |= 4
+                    if mask == 0:
+                        continue
+                    
+                    if rotation == 90:
+                        rx = z
+                    elif rotation == 180:
+                        rx = s1 - x
+                    elif rotation == 270:
+                        rx = s1 - z
+                    else:
+                        rx = x
+                    
+                    out_ids[count] = block
+                    iso_x[count] = (2 * rx - d) * half_w
+                    iso_y[count] = d * half_h - y * tile_h
+                    faces[count] = mask
+                    count += 1
+        return out_ids[:count], iso_x[:count], iso_y[:count], faces[:count]
+
+
+def project_blocks(grid, rotation, half_w, half_h, tile_h, occ):
+    """
+    Project blocks to iso offsets, drop fully hidden ones and order them back
+    to front. Returns (ids, iso_x, iso_y, face_bits) for the visible blocks in
+    draw order. grid is the block-id grid; occ is the occluder grid: a face is
+    hidden when the cell it faces is nonzero there.
+    """
+    if NUMBA_AVAILABLE:
+        return _project_scene_jit(grid, occ, rotation, half_w, half_h, tile_h)
+    return _project_blocks_numpy(grid, rotation, half_w, half_h, tile_h, occ)
 
 
 class MinecraftBlock:
@@ -182,16 +366,21 @@ class MinecraftBuildPreview:
     
     # Performance constants
     REDRAW_DELAY = 16  # ~60 FPS limit
+    DEBOUNCE_DELAY = 50  # ms of quiet before a resize or wheel burst redraws
     ZOOM_CACHE_THRESHOLD = 0.1  # Only cache textures for zoom levels that differ by this much
+    QUANTIZED_SIZES = (8, 12, 16, 24, 32, 48, 64, 96, 128)  # Texture warp sizes (x1.5 ladder)
+    TRANSPARENT_BLOCKS = frozenset({'air', 'glass', 'water', 'ice'})  # Don't hide neighbour faces
     
     def __init__(self, root):
         self.root = root
         self.root.title("Minecraft Build Preview")
         self.root.geometry("1920x1080")
         
-        # Build data - 3D array [x][z][y]
+        # Build data - 3D array [x][z][y] of block ids (index into
+        # self._block_names); id 0 is "air", i.e. an empty cell
         self.build_size = 16
-        self.build_data = {}  # Dictionary with (x,z,y) as keys
+        self._occ = np.zeros((self.build_size,) * 3, np.uint8)
+        self._block_counts = None  # blocks per id, kept up to date by _set_block
         self.current_y = 0
         self.current_block = "stone"
         
@@ -203,15 +392,74 @@ class MinecraftBuildPreview:
         self.pan_start_x = 0
         self.pan_start_y = 0
         self.is_panning = False
+        self._pan_moved = False  # set when a drag moved the view; redraw on release
+        self._iso_frame_complete = False  # last iso frame held every block in full
         
         # Performance optimization flags
         self._pending_grid_update = False
         self._pending_iso_update = False
+        self._redraw_pending = False  # grid cells queued for _flush_redraw
+        self._grid_dirty = []
+        self._last_drag_cell = None  # (x, z, y, block) last painted this stroke
+        self._info_text = None  # last text shown by update_info
+        self._last_log = {}  # message -> time _log_error last logged it
+        self._resize_after = None  # pending debounced resize / zoom redraws
+        self._zoom_after = None
+        self._wheel_accum = 0  # wheel ticks (+in / -out) not yet applied
+        self._zoom_counter = 0
         self._last_canvas_size = (0, 0)
-        self._cached_canvas_dimensions = {}
         
-        # Pre-calculate color variations
-        self._color_cache = {}
+        # The whole grid is rasterized into one image shown through a single
+        # canvas item: with PIL see _render_grid_image (fonts keyed by pixel
+        # size), without it see _render_grid_photo (lines cached in their own
+        # PhotoImage, labels kept as reusable text items)
+        self._grid_image = None
+        self._grid_photo = None
+        self._grid_image_id = None
+        self._grid_fonts = {}
+        self._grid_lines_photo = None
+        self._grid_lines_key = None
+        self._grid_labels = {}  # (x, z) -> text item showing that cell's label
+        self._grid_label_pool = []  # hidden text items ready for reuse
+        
+        # Canvas sizes, kept current by <Configure> so nothing has to query Tk
+        self._grid_dims = (self.DEFAULT_CANVAS_WIDTH, self.DEFAULT_CANVAS_HEIGHT)
+        self._iso_dims = (self.ISO_CANVAS_WIDTH, self.ISO_CANVAS_HEIGHT)
+        self._grid_cell_size = None  # (cell_width, cell_height), reset on resize
+        self._grid_cell_inv = None  # cells per pixel, set along with it
+        
+        # Offscreen RGBA framebuffer for the iso view, the PhotoImage and the
+        # canvas item it is shown through (both kept across frames), and
+        # per-size face atlases (see _get_face_atlas)
+        self._iso_fb = None
+        self._iso_photo = None
+        self._iso_photo_id = None
+        
+        # View the framebuffer was last fully drawn for, and the (x, z, y)
+        # cells edited since the last iso frame (None: redraw everything);
+        # while the view holds, only the edited cells' boxes are recomposited
+        self._iso_frame_key = None
+        self._iso_dirty = None
+        
+        # Without PIL: polygon items reused across frames in draw order,
+        # their current fills, and how many the frame being drawn has used
+        self._poly_pool = []
+        self._poly_fills = []
+        self._poly_used = 0
+        self._face_atlases = OrderedDict()
+        
+        # 0/1 grid of the cells that hide their neighbours' faces (opaque
+        # blocks) for projection; rebuilt when marked dirty
+        self._occluders = None
+        self._blocks_dirty = True
+        
+        # Pre-calculated face colors: block name -> index, the block objects
+        # by index, and per index a (top, left, right) tuple as '#rrggbb'
+        # strings (Tk) and RGB tuples (PIL)
+        self._block_index = {}
+        self._block_objs = []
+        self._face_colors = []
+        self._face_colors_rgb = []
         
         # Dark mode settings - Initialize before setup_ui
         self.dark_mode = False
@@ -315,11 +563,30 @@ class MinecraftBuildPreview:
     
     def _precalculate_colors(self):
         """Pre-calculate all color variations to avoid runtime computation"""
-        factors = [0.6, 0.8, 1.2]  # right, left, top
-        for block_name, block in self.blocks.items():
-            self._color_cache[block_name] = {}
-            for factor in factors:
-                self._color_cache[block_name][factor] = self.lighten_color(block.color, factor)
+        # "air" is the first block, so its id 0 doubles as the empty cell
+        self._block_index = {name: idx for idx, name in enumerate(self.blocks)}
+        self._block_names = list(self.blocks)
+        self._block_objs = list(self.blocks.values())
+        
+        # 1 for blocks that occlude, indexed by id; air and see-through blocks are 0
+        self._opaque = np.array([name not in self.TRANSPARENT_BLOCKS
+                                 for name in self._block_names], np.uint8)
+        
+        # Parse every hex color once into an (N_blocks, 3) array
+        rgb = np.array([
+            (int(block.color[1:3], 16), int(block.color[3:5], 16), int(block.color[5:7], 16))
+            for block in self.blocks.values()
+        ], np.uint32)
+        
+        # Shade all blocks at once per factor (same fixed-point math as the
+        # texture shading tables) into (N_blocks, 3 faces, 3) top/left/right
+        shaded = np.stack([
+            np.minimum((rgb * round(factor * 256)) >> 8, 255)
+            for factor in (1.2, 0.8, 0.6)
+        ], axis=1).tolist()
+        self._face_colors_rgb = [tuple(tuple(c) for c in faces) for faces in shaded]
+        self._face_colors = [tuple("#%02x%02x%02x" % c for c in faces)
+                             for faces in self._face_colors_rgb]
     
     def setup_ui(self):
         """Setup the user interface"""
@@ -368,6 +635,7 @@ class MinecraftBuildPreview:
         self.iso_canvas.pack(fill=tk.BOTH, expand=True)
         
         # Bind mouse events for panning
+        self.iso_canvas.bind("<Configure>", self._on_iso_configure)
         self.iso_canvas.bind("<Button-1>", self.start_pan)
         self.iso_canvas.bind("<B1-Motion>", self.do_pan)
         self.iso_canvas.bind("<ButtonRelease-1>", self.end_pan)
@@ -432,15 +700,22 @@ class MinecraftBuildPreview:
         self.grid_canvas.pack(padx=10, pady=10)
         
         # Bind grid click events
+        self.grid_canvas.bind("<Configure>", self._on_grid_configure)
         self.grid_canvas.bind("<Button-1>", self.grid_click)
         self.grid_canvas.bind("<B1-Motion>", self.grid_drag)
+        self.grid_canvas.bind("<ButtonRelease-1>", self.grid_release)
         self.grid_canvas.bind("<Motion>", self.grid_hover)
         self.grid_canvas.bind("<Leave>", self.grid_leave)
         
-        # Hover state tracking
+        # Grid label fonts, resolved by Tk once instead of per text item
+        self._font_small = tkfont.Font(family="Arial", size=7)
+        self._font_med = tkfont.Font(family="Arial", size=8)
+        
+        # Hover state tracking; the outline is created once and moved/hidden
         self.hover_x = -1
         self.hover_z = -1
-        self.hover_outline_id = None
+        self.hover_outline_id = self.grid_canvas.create_rectangle(
+            0, 0, 0, 0, fill="", outline="red", width=2, state='hidden')
     
     def get_theme_color(self, key):
         """Get color for current theme"""
@@ -527,107 +802,131 @@ class MinecraftBuildPreview:
         """Handle grid drag to paint blocks"""
         self.place_block_at_click(event.x, event.y)
     
+    def grid_release(self, event):
+        """End a paint stroke"""
+        self._last_drag_cell = None
+    
     def grid_hover(self, event):
         """Handle mouse hover over grid to show red outline"""
         try:
-            canvas_width, canvas_height = self.get_canvas_dimensions('grid')
-            
-            cell_width = canvas_width / self.build_size
-            cell_height = canvas_height / self.build_size
-            
-            grid_x = int(event.x / cell_width)
-            grid_z = int(event.y / cell_height)
-            
-            # Check if we're within grid bounds
-            if 0 <= grid_x < self.build_size and 0 <= grid_z < self.build_size:
+            cell = self._grid_cell_at(event.x, event.y)
+            if cell is not None:
                 # Only update if hover position changed
+                grid_x, grid_z = cell
                 if grid_x != self.hover_x or grid_z != self.hover_z:
-                    # Remove old hover outline
-                    if self.hover_outline_id:
-                        self.grid_canvas.delete(self.hover_outline_id)
-                        self.hover_outline_id = None
-                    
-                    # Update hover position
-                    self.hover_x = grid_x
-                    self.hover_z = grid_z
-                    
-                    # Draw new hover outline
-                    x1 = grid_x * cell_width
-                    y1 = grid_z * cell_height
-                    x2 = x1 + cell_width
-                    y2 = y1 + cell_height
-                    
-                    self.hover_outline_id = self.grid_canvas.create_rectangle(
-                        x1, y1, x2, y2,
-                        fill="",
-                        outline="red",
-                        width=2
-                    )
+                    self.show_hover_outline(grid_x, grid_z)
             else:
                 # Mouse is outside grid bounds
                 self.clear_hover_outline()
                 
-        except Exception as e:
-            print(f"Error in grid hover: {e}")
+        except Exception:
+            self._log_error("Error in grid hover")
+    
+    def _log_error(self, message):
+        """Log the current exception, at most once a second per message so an
+        error that repeats every frame doesn't flood the log"""
+        now = time.monotonic()
+        if now - self._last_log.get(message, 0.0) > 1.0:
+            self._last_log[message] = now
+            log.exception(message)
     
     def grid_leave(self, event):
         """Handle mouse leaving the grid canvas"""
         self.clear_hover_outline()
     
+    def show_hover_outline(self, grid_x, grid_z):
+        """Move the hover outline to a cell; nothing else is redrawn"""
+        cell_width, cell_height = self._get_grid_cell_size()
+        
+        self.hover_x = grid_x
+        self.hover_z = grid_z
+        
+        x1 = grid_x * cell_width
+        y1 = grid_z * cell_height
+        self.grid_canvas.coords(self.hover_outline_id,
+                                x1, y1, x1 + cell_width, y1 + cell_height)
+        self.grid_canvas.itemconfigure(self.hover_outline_id, state='normal')
+    
     def clear_hover_outline(self):
         """Clear the hover outline"""
-        if self.hover_outline_id:
-            self.grid_canvas.delete(self.hover_outline_id)
-            self.hover_outline_id = None
+        if self.hover_x >= 0:
+            self.grid_canvas.itemconfigure(self.hover_outline_id, state='hidden')
         self.hover_x = -1
         self.hover_z = -1
     
     def place_block_at_click(self, click_x, click_y):
         """Place a block at the clicked position"""
         try:
-            canvas_width, canvas_height = self.get_canvas_dimensions('grid')
-            
-            cell_width = canvas_width / self.build_size
-            cell_height = canvas_height / self.build_size
-            
-            grid_x = int(click_x / cell_width)
-            grid_z = int(click_y / cell_height)
-            
-            if 0 <= grid_x < self.build_size and 0 <= grid_z < self.build_size:
-                if self.current_block == "air":
-                    # Remove block
-                    if (grid_x, grid_z, self.current_y) in self.build_data:
-                        del self.build_data[(grid_x, grid_z, self.current_y)]
-                else:
-                    # Place block
-                    self.build_data[(grid_x, grid_z, self.current_y)] = self.current_block
+            cell = self._grid_cell_at(click_x, click_y)
+            if cell is not None:
+                # Motion within the cell just painted repeats the same edit
+                grid_x, grid_z = cell
+                key = (grid_x, grid_z, self.current_y, self.current_block)
+                if key == self._last_drag_cell:
+                    return
+                self._last_drag_cell = key
                 
-                self.schedule_grid_update()
-                self.schedule_iso_update()
-        except Exception as e:
-            print(f"Error placing block: {e}")
+                # Place block ("air" removes it); repainting the same block
+                # over itself changes nothing
+                if self._set_block(grid_x, grid_z, self.current_y, self.current_block):
+                    # Only the edited cell changes on the grid; a drag's
+                    # edits are repainted together once per frame
+                    self._grid_dirty.append((grid_x, grid_z))
+                    if not self._redraw_pending:
+                        self._redraw_pending = True
+                        self.root.after(self.REDRAW_DELAY, self._flush_redraw)
+                    self.schedule_iso_update((grid_x, grid_z, self.current_y))
+        except Exception:
+            self._log_error("Error placing block")
+    
+    def _set_block(self, x, z, y, block_type):
+        """Set one cell of the build; returns False if it already held that block"""
+        block_id = self._block_index[block_type]
+        if self._occ[x, z, y] == block_id:
+            return False
+        if self._block_counts is not None:
+            self._block_counts[self._occ[x, z, y]] -= 1
+            self._block_counts[block_id] += 1
+        self._occ[x, z, y] = block_id
+        self._blocks_dirty = True
+        return True
     
     def get_canvas_dimensions(self, canvas_type):
-        """Get canvas dimensions with caching to avoid repeated winfo calls"""
+        """Get canvas dimensions as last reported by <Configure>"""
         if canvas_type == 'grid':
-            canvas = self.grid_canvas
-            default = (self.DEFAULT_CANVAS_WIDTH, self.DEFAULT_CANVAS_HEIGHT)
-        else:
-            canvas = self.iso_canvas
-            default = (self.ISO_CANVAS_WIDTH, self.ISO_CANVAS_HEIGHT)
-        
-        # Use cached dimensions if available and canvas hasn't been resized
-        cache_key = f"{canvas_type}_{canvas.winfo_width()}_{canvas.winfo_height()}"
-        if cache_key not in self._cached_canvas_dimensions:
-            width = canvas.winfo_width()
-            height = canvas.winfo_height()
-            
-            if width <= 1 or height <= 1:
-                width, height = default
-            
-            self._cached_canvas_dimensions[cache_key] = (width, height)
-        
-        return self._cached_canvas_dimensions[cache_key]
+            return self._grid_dims
+        return self._iso_dims
+    
+    def _on_grid_configure(self, event):
+        """Track the grid canvas size"""
+        if event.width > 1 and event.height > 1:
+            self._grid_dims = (event.width, event.height)
+            self._grid_cell_size = None
+    
+    def _on_iso_configure(self, event):
+        """Track the isometric canvas size"""
+        if event.width > 1 and event.height > 1:
+            self._iso_dims = (event.width, event.height)
+    
+    def _get_grid_cell_size(self):
+        """Grid cell size for drawing and mouse handlers, without querying the canvas"""
+        if self._grid_cell_size is None:
+            canvas_width, canvas_height = self._grid_dims
+            self._grid_cell_size = (canvas_width / self.build_size,
+                                    canvas_height / self.build_size)
+            self._grid_cell_inv = (self.build_size / canvas_width,
+                                   self.build_size / canvas_height)
+        return self._grid_cell_size
+    
+    def _grid_cell_at(self, px, py):
+        """(grid_x, grid_z) under a grid canvas point, or None if off the grid"""
+        canvas_width, canvas_height = self._grid_dims
+        if not (0 <= px < canvas_width and 0 <= py < canvas_height):
+            return None
+        self._get_grid_cell_size()
+        inv_x, inv_z = self._grid_cell_inv
+        return (min(int(px * inv_x), self.build_size - 1),
+                min(int(py * inv_z), self.build_size - 1))
     
     def schedule_grid_update(self):
         """Schedule a grid update with debouncing"""
@@ -640,8 +939,13 @@ class MinecraftBuildPreview:
         self._pending_grid_update = False
         self.update_grid()
     
-    def schedule_iso_update(self):
-        """Schedule an isometric update with debouncing"""
+    def schedule_iso_update(self, cell=None):
+        """Schedule an isometric update with debouncing; pass the (x, z, y) cell
+        if a single block edit is all that changed"""
+        if cell is None:
+            self._iso_dirty = None
+        elif self._iso_dirty is not None:
+            self._iso_dirty.append(cell)
         if not self._pending_iso_update:
             self._pending_iso_update = True
             self.root.after(self.REDRAW_DELAY, self._do_iso_update)
@@ -654,122 +958,311 @@ class MinecraftBuildPreview:
     def update_grid(self):
         """Update the 2D grid display with ghost layer"""
         try:
-            # Store current hover state before clearing
-            old_hover_x = self.hover_x
-            old_hover_z = self.hover_z
-            
-            self.grid_canvas.delete("all")
-            
-            # Reset hover outline ID since canvas was cleared
-            self.hover_outline_id = None
-            
             canvas_width, canvas_height = self.get_canvas_dimensions('grid')
+            cell_width, cell_height = self._get_grid_cell_size()
             
-            cell_width = canvas_width / self.build_size
-            cell_height = canvas_height / self.build_size
-            
-            # Pre-calculate grid lines
-            grid_lines = []
-            for i in range(self.build_size + 1):
-                x = i * cell_width
-                y = i * cell_height
-                grid_lines.extend([
-                    (x, 0, x, canvas_height),
-                    (0, y, canvas_width, y)
-                ])
-            
-            # Draw all grid lines at once
-            for x1, y1, x2, y2 in grid_lines:
-                self.grid_canvas.create_line(x1, y1, x2, y2, fill=self.get_theme_color('grid_line'))
-            
-            # Pre-filter blocks for current layer and ghost layer
-            current_layer_blocks = {
-                (x, z): block_type 
-                for (x, z, y), block_type in self.build_data.items() 
-                if y == self.current_y
-            }
-            
-            # Get ghost layer (previous Y layer) if it exists
-            ghost_layer_blocks = {}
-            if self.current_y > 0:
-                ghost_layer_blocks = {
-                    (x, z): block_type 
-                    for (x, z, y), block_type in self.build_data.items() 
-                    if y == self.current_y - 1
-                }
-            
-            # Draw ghost layer first (underneath current layer)
-            for (x, z), block_type in ghost_layer_blocks.items():
-                if block_type in self.blocks and (x, z) not in current_layer_blocks:
-                    # Only show ghost if there's no block on current layer
-                    block = self.blocks[block_type]
-                    
-                    x1 = x * cell_width
-                    y1 = z * cell_height
-                    x2 = x1 + cell_width
-                    y2 = y1 + cell_height
-                    
-                    # Create ghost appearance with transparency effect
-                    ghost_color = self.make_ghost_color(block.color)
-                    
-                    self.grid_canvas.create_rectangle(x1, y1, x2, y2, 
-                                                    fill=ghost_color, 
-                                                    outline=self.get_theme_color('ghost_outline'),
-                                                    width=1,
-                                                    stipple="gray25")  # Dotted pattern for ghost effect
-                    
-                    # Add faint text for ghost blocks if cell is large enough
-                    if cell_width > 30 and cell_height > 30:
-                        text_x = x1 + cell_width / 2
-                        text_y = y1 + cell_height / 2
-                        ghost_text_color = "#999999" if not self.dark_mode else "#666666"
-                        self.grid_canvas.create_text(text_x, text_y, 
-                                                   text=block_type[:3],
-                                                   font=("Arial", 7),
-                                                   fill=ghost_text_color)
+            # One image for the whole layer instead of items per cell
+            if PIL_AVAILABLE:
+                self._render_grid_image(canvas_width, canvas_height, cell_width, cell_height)
+            else:
+                self._render_grid_photo(canvas_width, canvas_height, cell_width, cell_height)
             
-            # Draw current layer blocks (on top of ghost layer)
-            for (x, z), block_type in current_layer_blocks.items():
-                if block_type in self.blocks:
-                    block = self.blocks[block_type]
-                    
-                    x1 = x * cell_width
-                    y1 = z * cell_height
-                    x2 = x1 + cell_width
-                    y2 = y1 + cell_height
-                    
-                    self.grid_canvas.create_rectangle(x1, y1, x2, y2, 
-                                                    fill=block.color, 
-                                                    outline="black")
-                    
-                    # Add block name text if cell is large enough
-                    if cell_width > 30 and cell_height > 30:
-                        text_x = x1 + cell_width / 2
-                        text_y = y1 + cell_height / 2
-                        self.grid_canvas.create_text(text_x, text_y, 
-                                                   text=block_type[:3],
-                                                   font=("Arial", 8),
-                                                   fill="white")
+            # Keep the hover outline above the new blocks and on its cell,
+            # which moves if the canvas or build size changed
+            self.grid_canvas.tag_raise(self.hover_outline_id)
+            if self.hover_x >= 0 and self.hover_z >= 0:
+                self.show_hover_outline(self.hover_x, self.hover_z)
             
-            # Restore hover outline if it was active
-            if old_hover_x >= 0 and old_hover_z >= 0:
-                self.hover_x = old_hover_x
-                self.hover_z = old_hover_z
-                
-                x1 = old_hover_x * cell_width
-                y1 = old_hover_z * cell_height
-                x2 = x1 + cell_width
-                y2 = y1 + cell_height
-                
-                self.hover_outline_id = self.grid_canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill="",
-                    outline="red",
-                    width=2
-                )
+        except Exception:
+            self._log_error("Error updating grid")
+    
+    def _render_grid_photo(self, canvas_width, canvas_height, cell_width, cell_height):
+        """Paint grid lines, ghost layer and current layer into one tk.PhotoImage"""
+        width, height = int(canvas_width), int(canvas_height)
+        if (self._grid_photo is None
+                or (self._grid_photo.width(), self._grid_photo.height()) != (width, height)):
+            self._grid_photo = tk.PhotoImage(width=width, height=height)
+            if self._grid_image_id is None:
+                self._grid_image_id = self.grid_canvas.create_image(
+                    0, 0, anchor='nw', image=self._grid_photo)
+                self.grid_canvas.tag_lower(self._grid_image_id)
+            else:
+                self.grid_canvas.itemconfigure(self._grid_image_id, image=self._grid_photo)
+        
+        # Start from the cached lines, then hide every label for reuse below
+        lines = self._get_grid_lines_photo(width, height, cell_width, cell_height)
+        self._grid_photo.tk.call(self._grid_photo, 'copy', lines)
+        self.grid_canvas.itemconfigure("label", state='hidden')
+        self._grid_label_pool.extend(self._grid_labels.values())
+        self._grid_labels.clear()
+        
+        layer = self._occ[:, :, self.current_y]
+        
+        # Ghost layer (previous Y layer) only where the current layer is empty
+        if self.current_y > 0:
+            ghost = np.where(layer == 0, self._occ[:, :, self.current_y - 1], 0)
+            for x0, x1, z, block_id in self._grid_runs(ghost):
+                self._put_grid_run(x0, x1, z, block_id, True, cell_width, cell_height)
+        
+        for x0, x1, z, block_id in self._grid_runs(layer):
+            self._put_grid_run(x0, x1, z, block_id, False, cell_width, cell_height)
+    
+    @staticmethod
+    def _grid_runs(cells):
+        """(x0, x1, z, block_id) for each run of equal, non-empty ids along x"""
+        rows = np.ascontiguousarray(cells.T)  # [z, x], so runs never cross rows
+        change = np.ones(rows.shape, bool)
+        change[:, 1:] = rows[:, 1:] != rows[:, :-1]
+        starts = np.flatnonzero(change)
+        ends = np.append(starts[1:], rows.size)
+        ids = rows.ravel()[starts]
+        keep = ids != 0
+        starts, ends, ids = starts[keep], ends[keep], ids[keep]
+        z, x0 = np.divmod(starts, rows.shape[1])
+        return zip(x0.tolist(), (x0 + ends - starts).tolist(), z.tolist(), ids.tolist())
+    
+    def _get_grid_lines_photo(self, width, height, cell_width, cell_height):
+        """Background and grid lines, rebuilt only when size, build size or theme change"""
+        key = (width, height, self.build_size, self.dark_mode)
+        if key != self._grid_lines_key:
+            self._grid_lines_key = key
+            photo = tk.PhotoImage(width=width, height=height)
+            photo.put(self.get_theme_color('canvas_bg'), to=(0, 0, width, height))
+            line_color = self.get_theme_color('grid_line')
+            for i in range(self.build_size):
+                x = int(i * cell_width)
+                y = int(i * cell_height)
+                photo.put(line_color, to=(x, 0, x + 1, height))
+                photo.put(line_color, to=(0, y, width, y + 1))
+            self._grid_lines_photo = photo
+        return self._grid_lines_photo
+    
+    def _put_grid_run(self, x0, x1, z, block_id, is_ghost, cell_width, cell_height):
+        """Paint cells [x0, x1) of row z, all one block, into the grid PhotoImage.
+        
+        Each cell owns the pixels from its own left/top line up to the next
+        cell's, so painting one never touches its neighbours. The outline
+        color goes down once for the whole run, then each cell's fill and
+        label on top of it.
+        """
+        block_type = self._block_names[block_id]
+        color = self._block_objs[block_id].color
+        y1, y2 = int(z * cell_height), int((z + 1) * cell_height)
+        
+        if is_ghost:
+            # Solid stand-in for the gray25 stipple over the background
+            fill = "#%02x%02x%02x" % self._stipple_color(self.make_ghost_color(color),
+                                                         self.get_theme_color('canvas_bg'))
+            outline = self.get_theme_color('ghost_outline')
+            text_color = "#999999" if not self.dark_mode else "#666666"
+            font = self._font_small
+        else:
+            fill = color
+            outline = "black"
+            text_color = "white"
+            font = self._font_med
+        
+        self._grid_photo.put(outline, to=(int(x0 * cell_width), y1,
+                                          int(x1 * cell_width), y2))
+        labels = cell_width > 30 and cell_height > 30
+        for x in range(x0, x1):
+            left, right = int(x * cell_width), int((x + 1) * cell_width)
+            if right - left > 2 and y2 - y1 > 2:
+                self._grid_photo.put(fill, to=(left + 1, y1 + 1, right - 1, y2 - 1))
             
-        except Exception as e:
-            print(f"Error updating grid: {e}")
+            if labels:
+                label = (self._grid_label_pool.pop() if self._grid_label_pool
+                         else self.grid_canvas.create_text(0, 0, tags="label"))
+                self.grid_canvas.coords(label, left + cell_width / 2, y1 + cell_height / 2)
+                self.grid_canvas.itemconfigure(label, text=block_type[:3], font=font,
+                                               fill=text_color, state='normal')
+                self._grid_labels[(x, z)] = label
+    
+    def _flush_redraw(self):
+        """Repaint the grid cells edited since the last flush"""
+        self._redraw_pending = False
+        cells, self._grid_dirty = self._grid_dirty, []
+        if cells:
+            self._redraw_cells(dict.fromkeys(cells))
+            self.update_info()
+    
+    def _redraw_cells(self, cells):
+        """Redraw some (x, z) cells of the current layer after edits"""
+        canvas_width, canvas_height = self.get_canvas_dimensions('grid')
+        cell_width, cell_height = self._get_grid_cell_size()
+        
+        if PIL_AVAILABLE:
+            if (self._grid_image is not None
+                    and self._grid_image.size == (int(canvas_width), int(canvas_height))):
+                for grid_x, grid_z in cells:
+                    self._repaint_grid_cell(grid_x, grid_z, cell_width, cell_height)
+                self._show_grid_image()
+            else:
+                self.update_grid()
+            return
+        
+        if (self._grid_photo is None
+                or self._grid_lines_key != (int(canvas_width), int(canvas_height),
+                                            self.build_size, self.dark_mode)):
+            self.update_grid()
+            return
+        
+        for grid_x, grid_z in cells:
+            self._repaint_photo_cell(grid_x, grid_z, cell_width, cell_height)
+    
+    def _repaint_photo_cell(self, grid_x, grid_z, cell_width, cell_height):
+        """Repaint one cell of the grid PhotoImage after an edit"""
+        # Put the cell's own pixels back to background and lines, drop its label
+        x1, x2 = int(grid_x * cell_width), int((grid_x + 1) * cell_width)
+        y1, y2 = int(grid_z * cell_height), int((grid_z + 1) * cell_height)
+        self._grid_photo.tk.call(self._grid_photo, 'copy', self._grid_lines_photo,
+                                 '-from', x1, y1, x2, y2, '-to', x1, y1)
+        label = self._grid_labels.pop((grid_x, grid_z), None)
+        if label is not None:
+            self.grid_canvas.itemconfigure(label, state='hidden')
+            self._grid_label_pool.append(label)
+        
+        block_id = self._occ[grid_x, grid_z, self.current_y]
+        if block_id:
+            self._put_grid_run(grid_x, grid_x + 1, grid_z, block_id, False,
+                               cell_width, cell_height)
+        elif self.current_y > 0:
+            # Cell is empty; show the ghost of the layer below if there is one
+            ghost_id = self._occ[grid_x, grid_z, self.current_y - 1]
+            if ghost_id:
+                self._put_grid_run(grid_x, grid_x + 1, grid_z, ghost_id, True,
+                                   cell_width, cell_height)
+    
+    def _render_grid_image(self, canvas_width, canvas_height, cell_width, cell_height):
+        """Rasterize grid lines, ghost layer and current layer into one image"""
+        self._grid_image = Image.new('RGB', (int(canvas_width), int(canvas_height)),
+                                     self.get_theme_color('canvas_bg'))
+        draw = ImageDraw.Draw(self._grid_image)
+        
+        line_color = self.get_theme_color('grid_line')
+        for i in range(self.build_size + 1):
+            x = i * cell_width
+            y = i * cell_height
+            draw.line((x, 0, x, canvas_height), fill=line_color)
+            draw.line((0, y, canvas_width, y), fill=line_color)
+        
+        self._paint_grid_cells(draw, 0, self.build_size, 0, self.build_size,
+                               cell_width, cell_height)
+        self._show_grid_image()
+    
+    def _repaint_grid_cell(self, grid_x, grid_z, cell_width, cell_height):
+        """Repaint one cell of the grid image after an edit"""
+        image = self._grid_image
+        draw = ImageDraw.Draw(image)
+        
+        def pixel_box(x0, z0, x1, z1):
+            # Pixels covered by cells [x0, x1) x [z0, z1), shared borders included
+            return (int(x0 * cell_width), int(z0 * cell_height),
+                    min(int(x1 * cell_width) + 2, image.width),
+                    min(int(z1 * cell_height) + 2, image.height))
+        
+        # Neighbours share the cell's border, so they are repainted over it in
+        # the same ghost-then-current order a full render uses; whatever they
+        # touch outside the cell is put back afterwards
+        nx0, nx1 = max(grid_x - 1, 0), min(grid_x + 2, self.build_size)
+        nz0, nz1 = max(grid_z - 1, 0), min(grid_z + 2, self.build_size)
+        region_box = pixel_box(nx0, nz0, nx1, nz1)
+        cell_box = pixel_box(grid_x, grid_z, grid_x + 1, grid_z + 1)
+        saved = image.crop(region_box)
+        
+        x1 = grid_x * cell_width
+        y1 = grid_z * cell_height
+        x2 = x1 + cell_width
+        y2 = y1 + cell_height
+        line_color = self.get_theme_color('grid_line')
+        draw.rectangle((x1, y1, x2, y2), fill=self.get_theme_color('canvas_bg'))
+        for x in (x1, x2):
+            draw.line((x, y1 - 2, x, y2 + 2), fill=line_color)
+        for y in (y1, y2):
+            draw.line((x1 - 2, y, x2 + 2, y), fill=line_color)
+        
+        self._paint_grid_cells(draw, nx0, nx1, nz0, nz1, cell_width, cell_height)
+        
+        cell = image.crop(cell_box)
+        image.paste(saved, region_box[:2])
+        image.paste(cell, cell_box[:2])
+    
+    def _paint_grid_cells(self, draw, x0, x1, z0, z1, cell_width, cell_height):
+        """Paint the ghost and current-layer cells in [x0, x1) x [z0, z1)"""
+        names = self._block_names
+        layer = self._occ[x0:x1, z0:z1, self.current_y]
+        labels = cell_width > 30 and cell_height > 30
+        
+        # Ghost layer (previous Y layer) first, only where the current layer is empty
+        if self.current_y > 0:
+            ghost = np.where(layer == 0, self._occ[x0:x1, z0:z1, self.current_y - 1], 0)
+            background = self.get_theme_color('canvas_bg')
+            outline = self.get_theme_color('ghost_outline')
+            ghost_text_color = "#999999" if not self.dark_mode else "#666666"
+            xs, zs = np.nonzero(ghost)
+            for x, z, block_id in zip(xs.tolist(), zs.tolist(), ghost[xs, zs].tolist()):
+                block_type = names[block_id]
+                fill = self._stipple_color(
+                    self.make_ghost_color(self._block_objs[block_id].color), background)
+                self._paint_grid_rect(draw, x0 + x, z0 + z, cell_width, cell_height,
+                                      fill, outline,
+                                      block_type[:3] if labels else None, ghost_text_color, 9)
+        
+        xs, zs = np.nonzero(layer)
+        for x, z, block_id in zip(xs.tolist(), zs.tolist(), layer[xs, zs].tolist()):
+            block_type = names[block_id]
+            self._paint_grid_rect(draw, x0 + x, z0 + z, cell_width, cell_height,
+                                  self._block_objs[block_id].color, "black",
+                                  block_type[:3] if labels else None, "white", 11)
+    
+    def _paint_grid_rect(self, draw, x, z, cell_width, cell_height, fill, outline,
+                         label, label_color, font_size):
+        """Paint one filled cell, with its label centered if given"""
+        x1 = x * cell_width
+        y1 = z * cell_height
+        draw.rectangle((x1, y1, x1 + cell_width, y1 + cell_height), fill=fill, outline=outline)
+        
+        if label:
+            font = self._get_grid_font(font_size)
+            left, top, right, bottom = draw.textbbox((0, 0), label, font=font)
+            draw.text((x1 + (cell_width - left - right) / 2,
+                       y1 + (cell_height - top - bottom) / 2),
+                      label, fill=label_color, font=font)
+    
+    def _show_grid_image(self):
+        """Push the grid image to its canvas item, reusing the PhotoImage if possible"""
+        if (self._grid_photo is not None
+                and (self._grid_photo.width(), self._grid_photo.height()) == self._grid_image.size):
+            self._grid_photo.paste(self._grid_image)
+            return
+        
+        self._grid_photo = ImageTk.PhotoImage(self._grid_image)
+        if self._grid_image_id is None:
+            self._grid_image_id = self.grid_canvas.create_image(
+                0, 0, anchor='nw', image=self._grid_photo)
+            self.grid_canvas.tag_lower(self._grid_image_id)
+        else:
+            self.grid_canvas.itemconfigure(self._grid_image_id, image=self._grid_photo)
+    
+    def _get_grid_font(self, size):
+        """PIL font for grid labels, loaded once per pixel size"""
+        font = self._grid_fonts.get(size)
+        if font is None:
+            try:
+                font = ImageFont.truetype("arial.ttf", size)
+            except OSError:
+                font = ImageFont.load_default()
+            self._grid_fonts[size] = font
+        return font
+    
+    @lru_cache(maxsize=128)
+    def _stipple_color(self, color, background):
+        """Solid color matching a gray25-stippled fill over the background"""
+        r, g, b = (c >> 8 for c in self.grid_canvas.winfo_rgb(color))
+        br, bg, bb = (c >> 8 for c in self.grid_canvas.winfo_rgb(background))
+        return (round(r * 0.25 + br * 0.75),
+                round(g * 0.25 + bg * 0.75),
+                round(b * 0.25 + bb * 0.75))
     
     @lru_cache(maxsize=128)
     def make_ghost_color(self, color):
@@ -798,9 +1291,8 @@ class MinecraftBuildPreview:
     
     def update_isometric(self):
         """Update the isometric 3D preview"""
+        dirty, self._iso_dirty = self._iso_dirty, []
         try:
-            self.iso_canvas.delete("all")
-            
             canvas_width, canvas_height = self.get_canvas_dimensions('iso')
             
             center_x = canvas_width / 2 + self.iso_offset_x
@@ -812,178 +1304,341 @@ class MinecraftBuildPreview:
             tile_width_scaled = tile_width * self.iso_zoom
             tile_height_scaled = tile_height * self.iso_zoom
             
-            # Sort blocks by depth for proper rendering
-            blocks_to_render = []
+            self._sync_block_arrays()
+            ids, iso_xs, iso_ys, faces = project_blocks(
+                self._occ, self.iso_rotation,
+                tile_width_scaled / 2, tile_height_scaled / 2, tile_height_scaled,
+                self._occluders
+            )
             
-            for (x, z, y), block_type in self.build_data.items():
-                if block_type not in self.blocks:
-                    continue
-                    
-                # Apply rotation
-                rx, rz = self.rotate_coordinates(x, z)
-                
-                iso_x = (rx - rz) * (tile_width_scaled / 2)
-                iso_y = (rx + rz) * (tile_height_scaled / 2) - y * tile_height_scaled
-                
-                # Calculate depth for sorting (back to front rendering)
-                depth = (rx + rz) + y * self.build_size * 2
-                
-                blocks_to_render.append((depth, iso_x, iso_y, block_type))
+            # If every block fits inside the canvas the frame is the whole
+            # scene, and panning it only needs a slide (see end_pan)
+            half = tile_width_scaled / 2 + 1
+            self._iso_frame_complete = bool(
+                ((iso_xs >= half - center_x)
+                 & (iso_xs <= canvas_width - center_x - half)
+                 & (iso_ys >= -center_y)
+                 & (iso_ys <= canvas_height - center_y - 2 * half)).all())
             
-            # Sort by depth (back to front)
-            blocks_to_render.sort(key=lambda x: x[0])
+            # Drop blocks that can't touch the canvas before anything is
+            # drawn; a block spans size x size from (x - size/2, y), so a
+            # one-size margin keeps every partly visible block
+            margin = tile_width_scaled + 1
+            on_screen = ((iso_xs > -center_x - margin)
+                         & (iso_xs < canvas_width - center_x + margin)
+                         & (iso_ys > -center_y - margin)
+                         & (iso_ys < canvas_height - center_y + margin))
+            if not on_screen.all():
+                ids, iso_xs, iso_ys, faces = (ids[on_screen], iso_xs[on_screen],
+                                              iso_ys[on_screen], faces[on_screen])
             
             # Render blocks
-            for depth, iso_x, iso_y, block_type in blocks_to_render:
-                block = self.blocks[block_type]
-                
-                final_x = center_x + iso_x
-                final_y = center_y + iso_y
-                
-                self.draw_isometric_block(final_x, final_y, block)
+            if PIL_AVAILABLE:
+                # No queued edits (e.g. a direct call emptied the queue): full frame
+                if dirty:
+                    dirty = project_cells(dirty, self.iso_rotation, self.build_size,
+                                          tile_width_scaled / 2, tile_height_scaled / 2,
+                                          tile_height_scaled)
+                else:
+                    dirty = None
+                self._composite_isometric(ids, iso_xs, iso_ys, faces, center_x, center_y,
+                                          canvas_width, canvas_height, dirty)
+                return
+            
+            # Pooled face polygons are moved into place below; anything else
+            # from the last frame goes
+            self.iso_canvas.delete("!pool")
+            self._poly_used = 0
+            
+            # Face polygons for every block at once: the per-zoom template
+            # offsets plus each block's anchor point
+            template = self._face_polygon_template(
+                tile_width_scaled, tile_width_scaled * self.BLOCK_HEIGHT_RATIO)
+            anchors = np.tile(np.column_stack((iso_xs + center_x, iso_ys + center_y)), 4)
+            points = (anchors[:, None, :] + template).tolist()
+            face_colors = self._face_colors
+            for block_idx, block_points, face_mask in zip(ids.tolist(), points, faces.tolist()):
+                self._draw_face_polygons(block_points, face_colors[block_idx], face_mask)
+            
+            # Drop polygons left over from a larger frame
+            used = self._poly_used
+            if used < len(self._poly_pool):
+                self.iso_canvas.delete(*self._poly_pool[used:])
+                del self._poly_pool[used:]
+                del self._poly_fills[used:]
                 
-        except Exception as e:
-            print(f"Error updating isometric view: {e}")
+        except Exception:
+            self._log_error("Error updating isometric view")
     
-    @lru_cache(maxsize=128)
-    def rotate_coordinates(self, x, z):
-        """Rotate coordinates based on current rotation - cached for performance"""
-        if self.iso_rotation == 0:
-            return x, z
-        elif self.iso_rotation == 90:
-            return z, self.build_size - 1 - x
-        elif self.iso_rotation == 180:
-            return self.build_size - 1 - x, self.build_size - 1 - z
-        elif self.iso_rotation == 270:
-            return self.build_size - 1 - z, x
-        return x, z
-    
-    def draw_isometric_block(self, x, y, block):
-        """Draw a single block in isometric view - optimized version"""
-        size = self.BLOCK_SIZE_ISO * self.iso_zoom
-        height = size * self.BLOCK_HEIGHT_RATIO
-        
-        # Round zoom to reduce texture cache size
-        rounded_zoom = round(self.iso_zoom, 1)
-        texture_size = max(16, int(self.BLOCK_SIZE_ISO * rounded_zoom))
-        
-        # Check if we have texture and PIL is available
-        if block.texture_path and PIL_AVAILABLE and os.path.exists(block.texture_path):
-            try:
-                # Generate textures for each face
-                directions = ['left', 'right', 'top']
-                textures = {}
-                
-                for direction in directions:
-                    texture = skew_to_trapezoid_optimized(
-                        block.texture_path, direction, texture_size
-                    )
-                    if texture:
-                        textures[direction] = texture
-                
-                # Position and draw textures
-                if 'left' in textures:
-                    self.iso_canvas.create_image(
-                        x - size/2, y,
-                        image=textures['left'],
-                        anchor='nw'
-                    )
-                
-                if 'right' in textures:
-                    self.iso_canvas.create_image(
-                        x, y,
-                        image=textures['right'],
-                        anchor='n'
-                    )
-                
-                if 'top' in textures:
-                    self.iso_canvas.create_image(
-                        x, y,
-                        image=textures['top'],
-                        anchor='n'
-                    )
-                
-                # Draw outlines
-                self._draw_block_outlines(x, y, size, height)
-                
-            except Exception as e:
-                print(f"Error rendering textured block: {e}")
-                self.draw_fallback_block(x, y, block, size, height)
-        else:
-            # Use fallback polygon rendering
-            self.draw_fallback_block(x, y, block, size, height)
-    
-    def _draw_block_outlines(self, x, y, size, height):
-        """Draw block outlines for textured blocks"""
-        # Calculate polygon points
-        top_points = [x, y, x+size/2, y+size/4, x, y+size/2, x-size/2, y+size/4]
-        left_points = [x-size/2, y+size/4, x, y+size/2, x, y+size/2+height, x-size/2, y+size/4+height]
-        right_points = [x, y+size/2, x+size/2, y+size/4, x+size/2, y+size/4+height, x, y+size/2+height]
-        
-        # Draw outlines
-        self.iso_canvas.create_polygon(left_points, fill='', outline="black", width=1)
-        self.iso_canvas.create_polygon(right_points, fill='', outline="black", width=1)
-        self.iso_canvas.create_polygon(top_points, fill='', outline="black", width=1)
-    
-    def draw_fallback_block(self, x, y, block, size, height):
-        """Draw block using colored polygons (fallback method) - optimized"""
-        # Use pre-calculated colors
-        block_name = block.name.lower().replace(" ", "_")
-        if block_name in self._color_cache:
-            top_color = self._color_cache[block_name][1.2]
-            left_color = self._color_cache[block_name][0.8]
-            right_color = self._color_cache[block_name][0.6]
+    def _sync_block_arrays(self):
+        """Rebuild the occluder grid from the block grid"""
+        if not self._blocks_dirty:
+            return
+        self._blocks_dirty = False
+        
+        self._occluders = self._opaque[self._occ]
+    
+    def _composite_isometric(self, ids, iso_xs, iso_ys, faces, center_x, center_y,
+                             canvas_width, canvas_height, dirty=None):
+        """
+        Rasterize sorted blocks into one framebuffer and show it as a single
+        image. dirty, if given, is the (iso_x, iso_y) offsets of edited cells:
+        when the view is unchanged since the last frame only their sprite
+        boxes are cleared and recomposited. Every face whose visibility an
+        edit changes lies on the edited cube, so inside its box.
+        """
+        size = max(1, round(self.BLOCK_SIZE_ISO * self.iso_zoom))
+        half = size / 2
+        
+        # Reuse the framebuffer unless the canvas changed size
+        fb = self._iso_fb
+        if fb is None or fb.shape[:2] != (canvas_height, canvas_width):
+            fb = self._iso_fb = np.empty((canvas_height, canvas_width, 4), np.uint8)
+            self._iso_frame_key = None
+        r, g, b = self.iso_canvas.winfo_rgb(self.get_theme_color('iso_canvas_bg'))
+        background = (r >> 8, g >> 8, b >> 8, 255)
+        
+        atlas_rgba, atlas_mask, sprites = self._get_face_atlas(size, ids)
+        
+        # Sprite corners for every block at once (np.rint rounds half to even,
+        # like round())
+        x0s = np.rint(iso_xs + (center_x - half)).astype(np.int64)
+        y0s = np.rint(iso_ys + center_y).astype(np.int64)
+        
+        key = (canvas_width, canvas_height, center_x, center_y, size, self.iso_rotation,
+               self.dark_mode)
+        if dirty is not None and key == self._iso_frame_key:
+            # A pixel of slack on each side covers rounding differences
+            dirty_xs = np.rint(dirty[0] + (center_x - half)).astype(np.int64).tolist()
+            dirty_ys = np.rint(dirty[1] + center_y).astype(np.int64).tolist()
+            clips = [(x0 - 1, y0 - 1, x0 + size + 1, y0 + size + 1)
+                     for x0, y0 in zip(dirty_xs, dirty_ys)]
         else:
-            # Fallback to runtime calculation
-            top_color = self.lighten_color(block.color, 1.2)
-            left_color = self.lighten_color(block.color, 0.8)
-            right_color = self.lighten_color(block.color, 0.6)
-        
-        # Calculate polygon points
-        top_points = [x, y, x+size/2, y+size/4, x, y+size/2, x-size/2, y+size/4]
-        left_points = [x-size/2, y+size/4, x, y+size/2, x, y+size/2+height, x-size/2, y+size/4+height]
-        right_points = [x, y+size/2, x+size/2, y+size/4, x+size/2, y+size/4+height, x, y+size/2+height]
-        
-        # Draw faces in correct order
-        self.iso_canvas.create_polygon(left_points, fill=left_color, outline="black", width=1)
-        self.iso_canvas.create_polygon(right_points, fill=right_color, outline="black", width=1)
-        self.iso_canvas.create_polygon(top_points, fill=top_color, outline="black", width=1)
-
-    @lru_cache(maxsize=256)
-    def lighten_color(self, color, factor):
-        """Lighten or darken a hex color - cached for performance"""
-        try:
-            if color.startswith('#'):
-                color = color[1:]
-            
-            # Ensure we have a valid hex color
-            if len(color) != 6:
-                return "#808080"  # Default gray
+            clips = [(0, 0, canvas_width, canvas_height)]
+        self._iso_frame_key = None  # the framebuffer is in flux until done
+        
+        for cx0, cy0, cx1, cy1 in clips:
+            cx0, cy0 = max(cx0, 0), max(cy0, 0)
+            cx1, cy1 = min(cx1, canvas_width), min(cy1, canvas_height)
+            if cx0 >= cx1 or cy0 >= cy1:
+                continue
+            fb[cy0:cy1, cx0:cx1] = background
             
-            r = int(color[0:2], 16)
-            g = int(color[2:4], 16)
-            b = int(color[4:6], 16)
+            # Only blocks overlapping the clip box, still back to front
+            hit = (x0s < cx1) & (x0s + size > cx0) & (y0s < cy1) & (y0s + size > cy0)
+            self._blit_blocks(fb, (cx0, cy0, cx1, cy1), size, ids[hit].tolist(),
+                              x0s[hit].tolist(), y0s[hit].tolist(), faces[hit].tolist(),
+                              atlas_rgba, atlas_mask, sprites)
+        self._iso_frame_key = key
+        
+        # Swap the finished frame into the existing image item; the canvas
+        # never shows a partially drawn scene
+        frame = Image.fromarray(fb)
+        if (self._iso_photo is not None
+                and (self._iso_photo.width(), self._iso_photo.height()) == frame.size):
+            self._iso_photo.paste(frame)
+        else:
+            self._iso_photo = ImageTk.PhotoImage(frame)
+            if self._iso_photo_id is None:
+                self._iso_photo_id = self.iso_canvas.create_image(
+                    0, 0, anchor='nw', image=self._iso_photo)
+            else:
+                self.iso_canvas.itemconfigure(self._iso_photo_id, image=self._iso_photo)
+        # The frame is drawn at the current offset; undo any panning slide
+        # (see do_pan)
+        self.iso_canvas.coords(self._iso_photo_id, 0, 0)
+    
+    def _blit_blocks(self, fb, clip, size, ids, x0s, y0s, faces,
+                     atlas_rgba, atlas_mask, sprites):
+        """Copy block sprites, back to front, into the clip box of the framebuffer"""
+        cx0, cy0, cx1, cy1 = clip
+        
+        # Back to front: each face overwrites whatever it covers
+        for block_idx, x0, y0, face_mask in zip(ids, x0s, y0s, faces):
+            x1 = x0 + size
+            y1 = y0 + size
             
-            r = max(0, min(255, int(r * factor)))
-            g = max(0, min(255, int(g * factor)))
-            b = max(0, min(255, int(b * factor)))
+            # Skip blocks entirely outside the clip box, clip the rest
+            if x1 <= cx0 or y1 <= cy0 or x0 >= cx1 or y0 >= cy1:
+                continue
+            sx0 = max(0, cx0 - x0)
+            sy0 = max(0, cy0 - y0)
+            sx1 = size - max(0, x1 - cx1)
+            sy1 = size - max(0, y1 - cy1)
             
-            return f"#{r:02x}{g:02x}{b:02x}"
-        except Exception:
-            return "#808080"  # Default gray on error
+            # One copy per block: its visible faces are pre-merged
+            sprite = sprites.get((block_idx, face_mask))
+            if sprite is None:
+                sprite = sprites[block_idx, face_mask] = self._bake_block_sprite(
+                    atlas_rgba, atlas_mask, block_idx, face_mask, size)
+            sprite_rgba, sprite_mask, opaque = sprite
+            if opaque:
+                np.copyto(fb[y0 + sy0:y0 + sy1, x0 + sx0:x0 + sx1],
+                          sprite_rgba[sy0:sy1, sx0:sx1],
+                          where=sprite_mask[sy0:sy1, sx0:sx1])
+            else:
+                # Alpha-over onto the (always opaque) framebuffer, so glass,
+                # water and soft texture edges show the blocks behind them
+                dst = fb[y0 + sy0:y0 + sy1, x0 + sx0:x0 + sx1, :3]
+                src = sprite_rgba[sy0:sy1, sx0:sx1]
+                alpha = src[:, :, 3:4].astype(np.uint16)
+                dst[:] = (src[:, :, :3] * alpha + dst * (255 - alpha) + 127) // 255
+    
+    def _get_face_atlas(self, size, ids):
+        """
+        Get the (rgba, opaque mask, block sprites) atlas for a sprite size,
+        making sure the faces of every block id in ids are filled in. The
+        atlas is one strip of size x size cells; block i's faces sit at
+        columns 3*i .. 3*i+2. Block sprites are filled lazily by
+        _composite_isometric, keyed by (block id, face bits).
+        """
+        atlas = self._face_atlases.get(size)
+        if atlas is not None:
+            self._face_atlases.move_to_end(size)
+        else:
+            n = len(self._block_names)
+            atlas = (np.zeros((size, size * 3 * n, 4), np.uint8),
+                     np.zeros((size, size * 3 * n, 1), bool),
+                     np.zeros(n, bool),
+                     {})
+            # A handful of zoom levels is plenty; drop the least recently used
+            if len(self._face_atlases) >= 8:
+                self._face_atlases.popitem(last=False)
+            self._face_atlases[size] = atlas
+        rgba, mask, filled, sprites = atlas
+        
+        missing = [idx for idx in np.unique(ids).tolist() if not filled[idx]]
+        self._warm_face_textures(missing, size)
+        
+        for block_idx in missing:
+            filled[block_idx] = True
+            block_type = self._block_names[block_idx]
+            for face_idx, (direction, bit) in enumerate(_FACE_ORDER):
+                col = (block_idx * 3 + face_idx) * size
+                face = np.asarray(self._render_face(block_type, direction, size))
+                rgba[:, col:col + size] = face
+                mask[:, col:col + size] = face[:, :, 3:4] > 0
+        return rgba, mask, sprites
+    
+    def _bake_block_sprite(self, atlas_rgba, atlas_mask, block_idx, face_mask, size):
+        """Merge a block's visible faces into one size x size sprite"""
+        rgba = np.zeros((size, size, 4), np.uint8)
+        mask = np.zeros((size, size, 1), bool)
+        for face_idx, (direction, bit) in enumerate(_FACE_ORDER):
+            if face_mask & bit:
+                col = (block_idx * 3 + face_idx) * size
+                face_opaque = atlas_mask[:, col:col + size]
+                np.copyto(rgba, atlas_rgba[:, col:col + size], where=face_opaque)
+                mask |= face_opaque
+        # Fully opaque sprites can be copied; the rest are blended
+        opaque = bool((rgba[:, :, 3:4][mask] == 255).all())
+        return rgba, mask, opaque
+    
+    def _warm_face_textures(self, block_ids, size):
+        """Warp the uncached textured faces of these blocks on the worker pool"""
+        tex_size = self._quantize_iso_size(size)
+        paths = []
+        for block_idx in block_ids:
+            path = self._block_objs[block_idx].texture_path
+            if path and path not in paths and os.path.exists(path):
+                paths.append(path)
+        
+        def warm(path):
+            # One job per texture: the first face decodes it into the
+            # source cache and the other two directions reuse that
+            for direction, bit in _FACE_ORDER:
+                _make_face_image(path, direction, tex_size, 0.2)
+        
+        # Results land in the _make_face_image LRU, read back when the
+        # atlas is filled on the Tk thread
+        if len(paths) > 1:
+            list(_texture_executor.map(warm, paths))
+    
+    def _render_face(self, block_type, direction, size):
+        """Render one outlined block face as a size x size RGBA image"""
+        block = self.blocks[block_type]
+        face = None
+        if block.texture_path and os.path.exists(block.texture_path):
+            # Warp at the nearest quantized size so zoom drift reuses textures
+            tex_size = self._quantize_iso_size(size)
+            face = _make_face_image(block.texture_path, direction, tex_size, 0.2)
+            if face is not None and tex_size != size:
+                face = face.resize((size, size), Image.BILINEAR)
+        
+        if face is None:
+            # Solid face in the pre-calculated shade
+            slot = {'top': 0, 'left': 1, 'right': 2}[direction]
+            fill = self._face_colors_rgb[self._block_index[block_type]][slot]
+            face = Image.new("RGBA", (size, size), (0, 0, 0, 0))
+        else:
+            fill = None
+            face = face.copy()
+        
+        # Face polygon inside the sprite (last pixel row/column is size - 1)
+        span = size - 1
+        x = span / 2
+        height = span * self.BLOCK_HEIGHT_RATIO
+        if direction == 'top':
+            points = [x, 0, x+span/2, span/4, x, span/2, x-span/2, span/4]
+        elif direction == 'left':
+            points = [x-span/2, span/4, x, span/2, x, span/2+height, x-span/2, span/4+height]
+        else:
+            points = [x, span/2, x+span/2, span/4, x+span/2, span/4+height, x, span/2+height]
+        ImageDraw.Draw(face).polygon(points, fill=fill, outline="black")
+        return face
+    
+    def _quantize_iso_size(self, s):
+        """Snap a texture size to the nearest entry of QUANTIZED_SIZES"""
+        return min(self.QUANTIZED_SIZES, key=lambda q: abs(q - s))
+    
+    def _clear_texture_caches(self):
+        """Drop warped textures and face atlases"""
+        _make_face_image.cache_clear()
+        self._face_atlases.clear()
     
+    @lru_cache(maxsize=16)
+    def _face_polygon_template(self, size, height):
+        """(3, 8) left/right/top face polygon offsets from a block's anchor point"""
+        return np.array([
+            [-size/2, size/4, 0, size/2, 0, size/2+height, -size/2, size/4+height],
+            [0, size/2, size/2, size/4, size/2, size/4+height, 0, size/2+height],
+            [0, 0, size/2, size/4, 0, size/2, -size/2, size/4],
+        ])
+    
+    def _draw_face_polygons(self, points, colors, face_mask):
+        """Draw a block's visible left/right/top polygons with its (top, left, right) colors"""
+        top_color, left_color, right_color = colors
+        
+        # Draw faces in correct order, reusing pooled polygons; the pool is
+        # in creation (= stacking) order, so slot i always draws above i - 1
+        canvas = self.iso_canvas
+        pool = self._poly_pool
+        fills = self._poly_fills
+        for points, color, (direction, bit) in zip(points, (left_color, right_color, top_color),
+                                                   _FACE_ORDER):
+            # Faces hidden by a neighbour take no pool slot
+            if not face_mask & bit:
+                continue
+            i = self._poly_used
+            self._poly_used = i + 1
+            if i < len(pool):
+                canvas.coords(pool[i], *points)
+                if fills[i] != color:
+                    canvas.itemconfigure(pool[i], fill=color)
+                    fills[i] = color
+            else:
+                pool.append(canvas.create_polygon(points, fill=color, outline="black",
+                                                  width=1, tags="pool"))
+                fills.append(color)
+
     def rotate_left(self):
         """Rotate view 90 degrees left"""
         self.iso_rotation = (self.iso_rotation - 90) % 360
-        # Clear coordinate cache when rotating
-        self.rotate_coordinates.cache_clear()
         self.schedule_iso_update()
     
     def rotate_right(self):
         """Rotate view 90 degrees right"""
         self.iso_rotation = (self.iso_rotation + 90) % 360
-        # Clear coordinate cache when rotating
-        self.rotate_coordinates.cache_clear()
         self.schedule_iso_update()
     
     def reset_view(self):
@@ -992,14 +1647,12 @@ class MinecraftBuildPreview:
         self.iso_zoom = 1.0
         self.iso_offset_x = 0
         self.iso_offset_y = 0
-        # Clear caches
-        self.rotate_coordinates.cache_clear()
-        self._cached_canvas_dimensions.clear()
         self.schedule_iso_update()
     
     def start_pan(self, event):
         """Start panning the isometric view"""
         self.is_panning = True
+        self._pan_moved = False
         self.pan_start_x = event.x
         self.pan_start_y = event.y
     
@@ -1015,11 +1668,22 @@ class MinecraftBuildPreview:
             self.pan_start_x = event.x
             self.pan_start_y = event.y
             
-            self.schedule_iso_update()
+            # Slide what is already drawn instead of re-rasterizing; the
+            # next redraw renders at the new offset and puts it back at 0,0
+            if dx or dy:
+                self.iso_canvas.move("all", dx, dy)
+                self._pan_moved = True
     
     def end_pan(self, event):
         """End panning the isometric view"""
         self.is_panning = False
+        
+        # Redraw once at rest to fill in what scrolled into view; a frame
+        # that already held the whole scene has nothing more to show
+        if self._pan_moved:
+            self._pan_moved = False
+            if not self._iso_frame_complete:
+                self.schedule_iso_update()
     
     def zoom_iso(self, event):
         """Zoom the isometric view with cross-platform support - optimized"""
@@ -1037,40 +1701,49 @@ class MinecraftBuildPreview:
             else:
                 return
             
-            old_zoom = self.iso_zoom
-            
-            if zoom_in:
-                self.iso_zoom *= self.ZOOM_FACTOR
-            else:
-                self.iso_zoom /= self.ZOOM_FACTOR
-            
-            self.iso_zoom = max(self.MIN_ZOOM, min(self.MAX_ZOOM, self.iso_zoom))
-            
-            # Only update if zoom actually changed significantly
-            if abs(self.iso_zoom - old_zoom) > 0.01:
-                # Clear texture cache periodically to prevent memory issues
-                if not hasattr(self, '_zoom_counter'):
-                    self._zoom_counter = 0
-                self._zoom_counter += 1
-                
-                if self._zoom_counter % 20 == 0:  # Clear every 20 zoom operations
-                    global _texture_cache
-                    _texture_cache.clear()
-                
-                self.schedule_iso_update()
+            # A wheel burst only counts ticks; it is applied and rendered
+            # once, after it settles (see _do_zoom)
+            self._wheel_accum += 1 if zoom_in else -1
+            if self._zoom_after:
+                self.root.after_cancel(self._zoom_after)
+            self._zoom_after = self.root.after(self.DEBOUNCE_DELAY, self._do_zoom)
                 
-        except Exception as e:
-            print(f"Error zooming: {e}")
+        except Exception:
+            self._log_error("Error zooming")
     
     def on_window_resize(self, event=None):
         """Handle window resize events - optimized"""
         # Only update if the main window is being resized
         if event and event.widget == self.root:
-            # Clear canvas dimension cache
-            self._cached_canvas_dimensions.clear()
-            # Schedule updates instead of immediate updates
-            self.root.after_idle(self.schedule_grid_update)
-            self.root.after_idle(self.schedule_iso_update)
+            # Tk sends <Configure> continuously while dragging; restart the
+            # timer on each one so the views redraw once the drag settles
+            if self._resize_after:
+                self.root.after_cancel(self._resize_after)
+            self._resize_after = self.root.after(self.DEBOUNCE_DELAY, self._do_resize)
+    
+    def _do_resize(self):
+        """Redraw both views after a resize burst"""
+        self._resize_after = None
+        self.schedule_grid_update()
+        self.schedule_iso_update()
+    
+    def _do_zoom(self):
+        """Apply a burst of wheel ticks in one step and redraw the isometric view"""
+        self._zoom_after = None
+        ticks, self._wheel_accum = self._wheel_accum, 0
+        
+        old_zoom = self.iso_zoom
+        self.iso_zoom = max(self.MIN_ZOOM, min(self.MAX_ZOOM,
+                                               self.iso_zoom * self.ZOOM_FACTOR ** ticks))
+        
+        # Only update if zoom actually changed significantly
+        if abs(self.iso_zoom - old_zoom) > 0.01:
+            # Clear texture cache periodically to prevent memory issues
+            self._zoom_counter += 1
+            if self._zoom_counter % 20 == 0:  # Clear every 20 zoom operations
+                self._clear_texture_caches()
+            
+            self.schedule_iso_update()
     
     def initial_render(self):
         """Initial render after UI setup"""
@@ -1079,66 +1752,148 @@ class MinecraftBuildPreview:
         self.update_info()
     
     def save_build(self):
-        """Save the current build to a JSON file"""
+        """Save the current build to a JSON or compressed NumPy (.npz) file"""
         try:
             from tkinter import filedialog
             
-            # Convert build data to serializable format
-            save_data = {
-                'build_data': {f"{x},{z},{y}": block_type 
-                              for (x, z, y), block_type in self.build_data.items()},
-                'build_size': self.build_size,
-                'version': '1.0'
-            }
-            
             filename = filedialog.asksaveasfilename(
                 defaultextension=".json",
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                filetypes=[("JSON files", "*.json"), ("Compressed builds", "*.npz"),
+                           ("All files", "*.*")],
                 title="Save Minecraft Build"
             )
             
             if filename:
-                with open(filename, 'w') as f:
-                    json.dump(save_data, f, indent=2)
-                print(f"Build saved to {filename}")
+                # Snapshot on the Tk thread; serializing and writing happen
+                # on a worker so large builds don't freeze the UI. Not a
+                # daemon, so closing the app mid-save still finishes the file
+                threading.Thread(target=self._write_build,
+                                 args=(filename, self._occ.copy(), self.build_size)).start()
                 
         except Exception as e:
             print(f"Error saving build: {e}")
     
+    def _write_build(self, filename, occ, build_size):
+        """Serialize a build snapshot and write it (worker thread)"""
+        # Write next to the target and swap it in at the end, so a failed
+        # or interrupted save never leaves a truncated build behind
+        tmp_filename = filename + '.tmp'
+        try:
+            if filename.lower().endswith('.npz'):
+                # The voxel grid as is, zlib-compressed, with the palette
+                # naming its ids
+                with open(tmp_filename, 'wb') as f:
+                    np.savez_compressed(f, voxels=occ, palette=np.array(self._block_names),
+                                        version=np.array('2.0'))
+            else:
+                # Version 2.0: blocks as one flat [x, z, y, id, ...] list, with
+                # the palette naming the ids so files don't depend on block order
+                xyz = np.argwhere(occ)
+                blocks = np.column_stack((xyz, occ[tuple(xyz.T)]))
+                save_data = {
+                    'version': '2.0',
+                    'build_size': build_size,
+                    'palette': self._block_names,
+                    'blocks': blocks.ravel().tolist()
+                }
+                
+                if ORJSON_AVAILABLE:
+                    with open(tmp_filename, 'wb') as f:
+                        f.write(orjson.dumps(save_data))
+                else:
+                    with open(tmp_filename, 'w') as f:
+                        json.dump(save_data, f, separators=(',', ':'))
+            os.replace(tmp_filename, filename)
+            message = f"Build saved to {filename}"
+        except Exception as e:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            message = f"Error saving build: {e}"
+        
+        # Report back on the Tk thread; it is gone if the app closed mid-save
+        try:
+            self.root.after(0, print, message)
+        except RuntimeError:
+            pass
+    
     def load_build(self):
-        """Load a build from a JSON file"""
+        """Load a build from a JSON or compressed NumPy (.npz) file"""
         try:
             from tkinter import filedialog
             
             filename = filedialog.askopenfilename(
-                filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
+                filetypes=[("JSON files", "*.json"), ("Compressed builds", "*.npz"),
+                           ("All files", "*.*")],
                 title="Load Minecraft Build"
             )
             
             if filename:
-                with open(filename, 'r') as f:
-                    save_data = json.load(f)
+                if filename.lower().endswith('.npz'):
+                    with np.load(filename) as data:
+                        voxels = data['voxels']
+                        save_data = {'build_size': voxels.shape[0], 'voxels': voxels,
+                                     'palette': data['palette'].tolist()}
+                elif ORJSON_AVAILABLE:
+                    with open(filename, 'rb') as f:
+                        save_data = orjson.loads(f.read())
+                else:
+                    with open(filename, 'r') as f:
+                        save_data = json.load(f)
                 
-                # Clear current build
-                self.build_data.clear()
+                # Decode into a new grid first: a malformed file raises here
+                # and leaves the current build and view state untouched
+                size = int(save_data.get('build_size', self.build_size))
+                if size < 1:
+                    raise ValueError(f"invalid build size {size}")
+                occ = np.zeros((size, size, size), np.uint8)
                 
                 # Load build data
-                if 'build_data' in save_data:
+                if 'voxels' in save_data:
+                    # .npz: the whole grid, ids remapped through its palette
+                    voxels = save_data['voxels']
+                    if voxels.shape != occ.shape:
+                        raise ValueError(f"voxel grid is {voxels.shape}, not a cube")
+                    palette = save_data['palette']
+                    remap = np.array([self._block_index.get(name, 0) for name in palette] + [0],
+                                     np.uint8)
+                    occ[:] = remap[np.minimum(voxels, len(palette))]
+                elif 'blocks' in save_data:
+                    # Version 2.0: map file palette ids to ours (unknown
+                    # names become air), drop out-of-range cells, scatter
+                    palette = save_data.get('palette', self._block_names)
+                    remap = np.array([self._block_index.get(name, 0) for name in palette] + [0],
+                                     np.uint8)
+                    blocks = np.asarray(save_data['blocks'], np.int64).reshape(-1, 4)
+                    x, z, y, ids = blocks.T
+                    keep = ((x >= 0) & (x < size) & (z >= 0) & (z < size)
+                            & (y >= 0) & (y < size))
+                    ids = np.where((ids >= 0) & (ids < len(palette)), ids, len(palette))
+                    occ[x[keep], z[keep], y[keep]] = remap[ids[keep]]
+                elif 'build_data' in save_data:
+                    # Version 1.0: {"x,z,y": block_type}
                     for coord_str, block_type in save_data['build_data'].items():
                         x, z, y = map(int, coord_str.split(','))
-                        if block_type in self.blocks:
-                            self.build_data[(x, z, y)] = block_type
+                        if block_type in self.blocks and 0 <= x < size and 0 <= z < size and 0 <= y < size:
+                            occ[x, z, y] = self._block_index[block_type]
                 
-                # Update build size if specified
-                if 'build_size' in save_data:
-                    self.build_size = save_data['build_size']
-                    self.y_scale.config(to=self.build_size - 1)
+                # Swap the decoded build in
+                self.build_size = size
+                self._occ = occ
+                self.y_scale.config(to=size - 1)
+                
+                # Keep the edited layer inside a smaller build
+                if self.current_y >= size:
+                    self.current_y = size - 1
+                    self.y_var.set(self.current_y)
+                    self.y_label.config(text=str(self.current_y))
+                self._blocks_dirty = True
+                self._block_counts = None
                 
                 # Clear caches and refresh views
-                self._cached_canvas_dimensions.clear()
-                self.rotate_coordinates.cache_clear()
+                self._grid_cell_size = None  # build size may have changed
                 self.schedule_grid_update()
                 self.schedule_iso_update()
+                self.update_info()
                 print(f"Build loaded from {filename}")
                 
         except Exception as e:
@@ -1149,19 +1904,19 @@ class MinecraftBuildPreview:
         try:
             from tkinter import messagebox
             
-            if self.build_data and messagebox.askyesno(
+            if self._occ.any() and messagebox.askyesno(
                 "Clear Build", 
                 "Are you sure you want to clear all blocks?"
             ):
-                self.build_data.clear()
+                self._occ[:] = 0
+                self._blocks_dirty = True
+                self._block_counts = None
                 # Clear caches
-                self._cached_canvas_dimensions.clear()
-                self.rotate_coordinates.cache_clear()
-                global _texture_cache
-                _texture_cache.clear()
+                self._clear_texture_caches()
                 
                 self.schedule_grid_update()
                 self.schedule_iso_update()
+                self.update_info()
                 print("Build cleared")
                 
         except Exception as e:
@@ -1170,27 +1925,33 @@ class MinecraftBuildPreview:
     def update_info(self):
         """Update the build information display - optimized"""
         try:
-            total_blocks = len(self.build_data)
+            # Count blocks by id in one pass after bulk changes; single edits
+            # keep the counts current (see _set_block)
+            if self._block_counts is None:
+                self._block_counts = np.bincount(self._occ.ravel(),
+                                                 minlength=len(self._block_names))
+            block_counts = self._block_counts[1:]  # id 0 is empty
+            total_blocks = int(block_counts.sum())
             
             # Only calculate detailed info if there are blocks
             if total_blocks > 0:
-                # Count blocks by type more efficiently
-                block_counts = {}
-                for block_type in self.build_data.values():
-                    block_counts[block_type] = block_counts.get(block_type, 0) + 1
-                
-                most_used = max(block_counts, key=block_counts.get)
-                info_text = f"Total Blocks: {total_blocks} | Most used: {most_used} ({block_counts[most_used]})"
+                most_used_id = int(block_counts.argmax()) + 1
+                most_used = self._block_names[most_used_id]
+                info_text = f"Total Blocks: {total_blocks} | Most used: {most_used} ({self._block_counts[most_used_id]})"
             else:
                 info_text = "Total Blocks: 0"
             
-            self.info_label.config(text=info_text)
+            # Skip the Tk round-trip when nothing visible changed
+            if info_text != self._info_text:
+                self._info_text = info_text
+                self.info_label.config(text=info_text)
             
-        except Exception as e:
-            print(f"Error updating info: {e}")
+        except Exception:
+            self._log_error("Error updating info")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.WARNING)
     root = tk.Tk()
     app = MinecraftBuildPreview(root)
     